@@ -1,6 +1,4 @@
-import copy
-from itertools import groupby
-from typing import TypedDict, Any
+from typing import TypedDict, Any, Optional
 
 Weight = TypedDict('Weight', {
     'amount': float,
@@ -19,8 +17,18 @@ class Exercise:
     def __init__(self, name: str, sets_: list[Set_]) -> None:
         self.name = name
         self.sets_ = sets_
-        all_units = set(map(lambda set_: set_['weight']['unit'], sets_))
-        assert len(all_units) <= 1, f"Detected multiple units in the Exercise: {all_units}"
+        if sets_:
+            first_unit = sets_[0]['weight']['unit']
+            for set_ in sets_:
+                unit = set_['weight']['unit']
+                assert unit == first_unit, f"Detected multiple units in the Exercise: {first_unit} vs {unit}"
+
+    @classmethod
+    def _unchecked(cls, name: str, sets_: list[Set_]) -> 'Exercise':
+        instance = cls.__new__(cls)
+        instance.name = name
+        instance.sets_ = sets_
+        return instance
 
     def __eq__(self, o: object) -> bool:
         if isinstance(o, Exercise):
@@ -30,26 +38,41 @@ class Exercise:
         return False
 
     def __repr__(self) -> str:
-        flattened = self.flatten()
-        repetitions_repr = []
-        for exercise in flattened:
-            repetition = exercise.sets_[0]
-            weight = repetition['weight']
-            repetitions_repr.append(f"{len(exercise.sets_)}x{repetition['repetitions']}@{weight['amount']}{weight['unit']}")
-        repetitions = ', '.join(repetitions_repr)
-        return f"{self.name}: {repetitions}"
+        parts: list[str] = [self.name, ": "]
+        previous: Optional[Set_] = None
+        count = 0
+        for set_ in self.sets_:
+            if previous is not None and (set_['weight'], set_['repetitions']) == (previous['weight'], previous['repetitions']):
+                count += 1
+                continue
+            if previous is not None:
+                self._append_run(parts, count, previous)
+                parts.append(", ")
+            previous = set_
+            count = 1
+        if previous is not None:
+            self._append_run(parts, count, previous)
+        return "".join(parts)
+
+    @staticmethod
+    def _append_run(parts: list[str], count: int, set_: Set_) -> None:
+        weight = set_['weight']
+        parts.extend((str(count), "x", str(set_['repetitions']), "@", str(weight['amount']), weight['unit']))
 
     def flatten(self) -> list[Any]:
-        result = []
-        for group in groupby(self.sets_, lambda x:(x['weight'], x['repetitions'])):
-            c = copy.deepcopy(self)
-            c.sets_ = list(group[1])
-            result.append(c)
+        result: list[Exercise] = []
+        current: list[Set_] = []
+        previous_key: Optional[tuple[Weight, int]] = None
+        for set_ in self.sets_:
+            key = (set_['weight'], set_['repetitions'])
+            if current and key != previous_key:
+                result.append(Exercise._unchecked(self.name, current))
+                current = []
+            current.append(set_)
+            previous_key = key
+        if current:
+            result.append(Exercise._unchecked(self.name, current))
         return result
 
     def total_volume(self) -> float:
-        total_volume: float = 0
-        group: Set_
-        for group in self.sets_:
-            total_volume += group['repetitions'] * group['weight']['amount']
-        return total_volume
+        return sum(set_['repetitions'] * set_['weight']['amount'] for set_ in self.sets_)
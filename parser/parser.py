@@ -1,3 +1,4 @@
+import re
 from typing import Any
 
 from antlr4 import CommonTokenStream, InputStream, ErrorNode
@@ -5,67 +6,93 @@ from antlr4 import CommonTokenStream, InputStream, ErrorNode
 from dist.trainingLexer import trainingLexer
 from dist.trainingParser import trainingParser
 from dist.trainingVisitor import trainingVisitor
-from . import Exercise, Units
+from . import Exercise, Set_, Units, Weight
+
+_WHOLE_SET_RE = re.compile(r'(\d+)x(\d+)x(\d+(?:\.\d+)?)k?\Z')
+_GROUP_OF_REP_RE = re.compile(r'(\d+)x(\d+)\Z')
+
+
+class _VisitState:
+    __slots__ = ('name', 'repetitions', 'weights')
+
+    def __init__(self) -> None:
+        self.name: str = ""
+        self.repetitions: list[Set_] = []
+        self.weights: list[float] = []
 
 
 class Formatter(trainingVisitor):
     def __init__(self) -> None:
         super().__init__()
         self.result: list[Exercise] = []
-        self.current: dict[str, Any] = {}
+        self.current = _VisitState()
+        self._weight_records: dict[float, Weight] = {}
+        self._kg = Units.KILOGRAM
 
     def visitExercise(self, ctx: trainingParser.ExerciseContext) -> None:
-        self.current = {'name': "", 'repetitions': [], 'weights': [], 'repetitions_val': []}
+        self.current = _VisitState()
         super().visitExercise(ctx)
-        self.result.append(Exercise(self.current['name'], self.current['repetitions']))
+        self.result.append(Exercise(self.current.name, self.current.repetitions))
 
     def visitExercise_name(self, ctx: trainingParser.Exercise_nameContext) -> Any:
         super().visitExercise_name(ctx)
-        self.current['name'] = ctx.EXERCISE_NAME().getText()
+        self.current.name = ctx.EXERCISE_NAME().getText()
 
     def visitWeight(self, ctx: trainingParser.WeightContext) -> Any:
         super().visitWeight(ctx)
-        self.current['weights'].append(float(ctx.getText().removesuffix('k')))
+        self.current.weights.append(float(ctx.getText().removesuffix('k')))
 
     def visitWhole_set_(self, ctx: trainingParser.Whole_set_Context) -> Any:
         super().visitWhole_set_(ctx)
         text: str = ctx.getText()
-        chunks = text.split('x')
-        number_of_series: int = int(chunks[0])
-        number_of_repetitions: int = int(chunks[1])
-        weight: float = float(chunks[2].removesuffix('k'))
-        for i in range(int(number_of_series)):
-            self.append_serie(number_of_repetitions, weight)
-        self.current['weights'] = []
+        match = _WHOLE_SET_RE.match(text)
+        assert match is not None, f"Cannot parse whole set '{text}'"
+        number_of_series: int = int(match.group(1))
+        number_of_repetitions: int = int(match.group(2))
+        weight: float = float(match.group(3))
+        self.append_series(number_of_series, number_of_repetitions, weight)
+        self.current.weights = []
 
     def visitGroup_of_rep_set(self, ctx: trainingParser.Group_of_rep_setContext) -> Any:
         super().visitGroup_of_rep_set(ctx)
-        chunks: list[str] = ctx.getText().split('x')
-        number_of_series: int = int(chunks[0])
-        number_of_repetitions: int = int(chunks[1])
-        weights_ = self.current['weights']
+        text = ctx.getText()
+        match = _GROUP_OF_REP_RE.match(text)
+        assert match is not None, f"Cannot parse group of sets '{text}'"
+        number_of_series: int = int(match.group(1))
+        number_of_repetitions: int = int(match.group(2))
+        weights_ = self.current.weights
         assert len(weights_) == 1, f"{weights_} is longer than 1"
-        for i in range(number_of_series):
-            self.append_serie(number_of_repetitions, weights_[0])
+        self.append_series(number_of_series, number_of_repetitions, weights_[0])
 
     def visitSingle_rep_set_(self, ctx: trainingParser.Single_rep_set_Context) -> Any:
         super().visitSingle_rep_set_(ctx)
         number_of_repetitions = int(ctx.getText())
-        for weight in self.current['weights']:
+        for weight in self.current.weights:
             self.append_serie(number_of_repetitions, weight)
 
     def visitFixed_reps_multiple_weight(self, ctx: trainingParser.Fixed_reps_multiple_weightContext) -> Any:
         super().visitFixed_reps_multiple_weight(ctx)
         repetitions = int(ctx.getChild(0).getText())
-        for weight in self.current['weights']:
+        for weight in self.current.weights:
             self.append_serie(repetitions, weight)
-        # del self.current['visitSingle_rep_set2']
-        self.current['weights'] = []
-        self.current['repetitions_val'] = []
+        self.current.weights = []
 
     def append_serie(self, number_of_repetitions: int, weight: float) -> None:
-        self.current['repetitions'].append(
-            {'repetitions': number_of_repetitions, 'weight': {'amount': weight, 'unit': Units.KILOGRAM}})
+        self.current.repetitions.append(
+            {'repetitions': number_of_repetitions, 'weight': self._weight_record(weight)})
+
+    def append_series(self, number_of_series: int, number_of_repetitions: int, weight: float) -> None:
+        # Set_ records are read-only downstream, so one record can back the whole run.
+        record: Set_ = {'repetitions': number_of_repetitions, 'weight': self._weight_record(weight)}
+        self.current.repetitions.extend([record] * number_of_series)
+
+    def _weight_record(self, weight: float) -> Weight:
+        # Weight dicts are never mutated downstream, so equal amounts can share one record.
+        record = self._weight_records.get(weight)
+        if record is None:
+            record = {'amount': weight, 'unit': self._kg}
+            self._weight_records[weight] = record
+        return record
 
     def visitErrorNode(self, node: ErrorNode) -> None:
         print(type(node))
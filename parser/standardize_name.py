@@ -1,5 +1,4 @@
-from itertools import chain
-from typing import TypedDict
+from typing import Iterable, TypedDict
 
 Synonym = TypedDict('Synonym', {
     'clean': str,
@@ -8,44 +7,61 @@ Synonym = TypedDict('Synonym', {
 
 
 class StandardizeName:
+    __slots__ = ('_run_cache',)
+
+    _synonyms: list[Synonym] = [
+        {'clean': 'overhead press', 'synonyms': ['oh', 'overhead', 'op']},
+        {'clean': 'bench press', 'synonyms': ['bench', 'bp']},
+        {'clean': 'machine lateral pull-down', 'synonyms': ['lat pull-down', 'lat pull down', 'mlpd']},
+        {'clean': 'machine row', 'synonyms': ['mr']},
+        {'clean': 'barbell row', 'synonyms': ['br']},
+        {'clean': 'squat', 'synonyms': ['s']},
+        {'clean': 'deadlift', 'synonyms': ['d']},
+        {'clean': 'machine leg extension', 'synonyms': ['mle']},
+        {'clean': 'machine leg curl', 'synonyms': ['mlc']},
+    ]
+    _alias_map: dict[str, str] = {
+        synonym.lower(): synonym_group['clean'].title()
+        for synonym_group in _synonyms
+        for synonym in synonym_group['synonyms']
+    }
+
     def __init__(self) -> None:
-        self._synonyms: list[Synonym] = [
-            {'clean': 'overhead press', 'synonyms': ['oh', 'overhead', 'op']},
-            {'clean': 'bench press', 'synonyms': ['bench', 'bp']},
-            {'clean': 'machine lateral pull-down', 'synonyms': ['lat pull-down', 'lat pull down', 'mlpd']},
-            {'clean': 'machine row', 'synonyms': ['mr']},
-            {'clean': 'barbell row', 'synonyms': ['br']},
-            {'clean': 'squat', 'synonyms': ['s']},
-            {'clean': 'deadlift', 'synonyms': ['d']},
-            {'clean': 'machine leg extension', 'synonyms': ['mle']},
-            {'clean': 'machine leg curl', 'synonyms': ['mlc']},
-        ]
-        self._check_synonym_configuration(self._synonyms)
+        if __debug__:
+            self._check_synonym_configuration(self._synonyms)
+        self._run_cache: dict[str, str] = {}
 
     def run(self, raw_name: str) -> str:
-        selected_name = self._original_or_synonym(raw_name)
-        return selected_name.title().rstrip()
+        cached = self._run_cache.get(raw_name)
+        if cached is None:
+            cached = self._standardize(raw_name)
+            self._run_cache[raw_name] = cached
+        return cached
 
-    def _original_or_synonym(self, raw_name: str) -> str:
-        for synonym_group in self._synonyms:
-            for synonym in synonym_group['synonyms']:
-                if raw_name.strip().casefold() == synonym.casefold():
-                    selected_name = synonym_group['clean']
-                    return selected_name
-        return raw_name
+    def _standardize(self, raw_name: str) -> str:
+        selected_name = self._alias_map.get(raw_name.strip().lower())
+        if selected_name is not None:
+            return selected_name
+        return raw_name.title().rstrip()
 
     def _check_synonym_configuration(self, synonyms: list[Synonym]) -> None:
         self._check_non_overlapping_synonyms(synonyms)
         self._check_non_repeating_clean_name(synonyms)
 
     def _check_non_repeating_clean_name(self, synonyms: list[Synonym]) -> None:
-        synonym_names = [synonym['clean'] for synonym in synonyms]
-        assert self.all_elements_are_different(synonym_names)
+        assert self.all_elements_are_different(synonym['clean'] for synonym in synonyms)
 
     def _check_non_overlapping_synonyms(self, synonyms: list[Synonym]) -> None:
-        synonym_elements = [synonym['synonyms'] for synonym in synonyms]
-        all_synonyms = list(chain(*synonym_elements))
-        assert self.all_elements_are_different(all_synonyms)
+        seen: set[str] = set()
+        for synonym_group in synonyms:
+            for synonym in synonym_group['synonyms']:
+                assert synonym not in seen, f"Duplicated synonym: {synonym}"
+                seen.add(synonym)
 
-    def all_elements_are_different(self, values: list[str]) -> bool:
-        return len(set(values)) == len(values)
+    def all_elements_are_different(self, values: Iterable[str]) -> bool:
+        seen: set[str] = set()
+        for value in values:
+            if value in seen:
+                return False
+            seen.add(value)
+        return True
@@ -1,6 +1,10 @@
 import unittest
 
-from parser import Exercise, Units
+from parser import Exercise, Set_, Units
+
+
+def serie(repetitions: int, amount: float, unit: str = Units.KILOGRAM) -> Set_:
+    return {'repetitions': repetitions, 'weight': {'amount': amount, 'unit': unit}}
 
 
 class TestModel(unittest.TestCase):
@@ -11,76 +15,76 @@ class TestModel(unittest.TestCase):
         repetition = 1
         amount = 10
         self.assertNotEqual(
-            Exercise('b', [{'repetitions': repetition, 'weight': {'amount': amount, 'unit': Units.KILOGRAM}}]),
+            Exercise('b', [serie(repetition, amount)]),
             Exercise('b', []))
 
     def test_exercise_group_by_weight_and_repetitions__should_flatten_when_all_match(self) -> None:
         unflattened = Exercise('name',
-                               [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+                               [serie(10, 40.0),
+                                serie(10, 40.0),
+                                serie(6, 40.0)])
         flattened_list_by_weight_and_repetitions = [
             Exercise('name', [
-                {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}}
+                serie(10, 40.0),
+                serie(10, 40.0)
             ]),
-            Exercise('name', [{'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+            Exercise('name', [serie(6, 40.0)])
         ]
 
         self.assertEqual(unflattened.flatten(), flattened_list_by_weight_and_repetitions)
 
     def test_exercise_group_by_weight_requires_exact_repetitions_and_weight(self) -> None:
         unflattened = Exercise('name',
-                               [{'repetitions': 50, 'weight': {'amount': 20.0, 'unit': 'kg'}},
-                                {'repetitions': 15, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 6, 'weight': {'amount': 60.0, 'unit': 'kg'}}])
+                               [serie(50, 20.0),
+                                serie(15, 40.0),
+                                serie(6, 60.0)])
         flattened_list_by_weight_and_repetitions = [
-            Exercise('name', [{'repetitions': 50, 'weight': {'amount': 20.0, 'unit': 'kg'}}]),
-            Exercise('name', [{'repetitions': 15, 'weight': {'amount': 40.0, 'unit': 'kg'}}]),
-            Exercise('name', [{'repetitions': 6, 'weight': {'amount': 60.0, 'unit': 'kg'}}])
+            Exercise('name', [serie(50, 20.0)]),
+            Exercise('name', [serie(15, 40.0)]),
+            Exercise('name', [serie(6, 60.0)])
         ]
 
         self.assertEqual(unflattened.flatten(), flattened_list_by_weight_and_repetitions)
 
     def test_exercise_group_by_weight_and_repetitions_requires_exact_repetitions(self) -> None:
         unflattened = Exercise('name',
-                               [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+                               [serie(10, 40.0),
+                                serie(6, 40.0)])
         flattened_list_by_weight_and_repetitions = [
-            Exercise('name', [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}}]),
-            Exercise('name', [{'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+            Exercise('name', [serie(10, 40.0)]),
+            Exercise('name', [serie(6, 40.0)])
         ]
         self.assertEqual(unflattened.flatten(), flattened_list_by_weight_and_repetitions)
 
     def test_exercise_group_by_weight_and_repetitions_requires_exact_weight(self) -> None:
         unflattened = Exercise('name',
-                               [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 10, 'weight': {'amount': 50.0, 'unit': 'kg'}}])
+                               [serie(10, 40.0),
+                                serie(10, 50.0)])
         flattened_list_by_weight = [
-            Exercise('name', [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}}]),
-            Exercise('name', [{'repetitions': 10, 'weight': {'amount': 50.0, 'unit': 'kg'}}])
+            Exercise('name', [serie(10, 40.0)]),
+            Exercise('name', [serie(10, 50.0)])
         ]
 
         self.assertEqual(unflattened.flatten(), flattened_list_by_weight)
 
     def test_flattened_exercise__should_repr_for_object(self) -> None:
         exercise = Exercise('name',
-                            [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                             {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+                            [serie(10, 40.0),
+                             serie(6, 40.0)])
         self.assertEqual(exercise.__repr__(), "name: 1x10@40.0kg, 1x6@40.0kg")
 
     def test_unflattened_exercise__should_repr_for_object(self) -> None:
         exercise = Exercise('name',
-                            [{'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                             {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                             {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}])
+                            [serie(10, 40.0),
+                             serie(10, 40.0),
+                             serie(6, 40.0)])
         self.assertEqual("name: 2x10@40.0kg, 1x6@40.0kg", exercise.__repr__())
 
     def test_exercise_sum_total_volume(self) -> None:
         exercise = Exercise('name',
                             [
-                                {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                                {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'kg'}}
+                                serie(10, 40.0),
+                                serie(6, 40.0)
                             ])
 
         self.assertEqual(exercise.total_volume(), 10 * 40 + 6 * 40)
@@ -90,8 +94,8 @@ class TestModel(unittest.TestCase):
         try:
             Exercise('name',
                      [
-                         {'repetitions': 10, 'weight': {'amount': 40.0, 'unit': 'kg'}},
-                         {'repetitions': 6, 'weight': {'amount': 40.0, 'unit': 'lb'}}
+                         serie(10, 40.0),
+                         serie(6, 40.0, unit='lb')
                      ])
         except AssertionError as e:
             captured_exception = e
@@ -3,20 +3,10 @@ import argparse
 
 
 def compute_programming(from_: float, to: float, days: int) -> list[float]:
-    result = [0.0 for _ in range(days)]
     increase = (to - from_) / ((days - 1) / 2)
-
-    from_top = to
-    from_base = from_
-
-    for i in range(len(result)):
-        if i % 2 == 0:
-            result[i] = from_base
-            from_base += increase
-        else:
-            result[i] = from_top
-            from_top -= increase
-
+    result = [0.0] * days
+    result[0::2] = [from_ + k * increase for k in range((days + 1) // 2)]
+    result[1::2] = [to - k * increase for k in range(days // 2)]
     return result
 
 
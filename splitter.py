@@ -1,8 +1,9 @@
 import copy
 import csv
+import multiprocessing
 import pprint
 import sys
-from typing import Any, TextIO, TypedDict, List
+from typing import Any, Iterator, Optional, TypedDict
 
 from antlr4 import InputStream, CommonTokenStream
 
@@ -20,6 +21,8 @@ Parsing2 = TypedDict('Parsing2', {
     'parsed': list[Exercise],
     'notes': str})
 
+_renamer = StandardizeName()
+
 
 class Splitter:
     def main(self, file: str) -> list[Parsing2]:
@@ -30,20 +33,38 @@ class Splitter:
         return exercises
 
     def _parse_exercises(self, jobs: list[Parsing1]) -> list[Parsing2]:
+        parsed = self._parse_payloads([job['payload'] for job in jobs])
         jobs2: list[Parsing2] = []
-        for job in jobs:
+        for job, exercises in zip(jobs, parsed):
             job_tmp: Any = copy.deepcopy(job)
-            job_tmp['parsed'] = self._parse(job['payload'])
+            job_tmp['parsed'] = exercises
             jobs2.append(job_tmp)
         return jobs2
 
+    @staticmethod
+    def _parse_payloads(payloads: list[str]) -> list[Any]:
+        if len(payloads) > 4:
+            with multiprocessing.Pool() as pool:
+                return pool.map(Splitter._parse, payloads)
+        lexer = trainingLexer(InputStream(''))
+        token_stream = CommonTokenStream(lexer)
+        parser = trainingParser(token_stream)
+        return [Splitter._parse_reusing(lexer, token_stream, parser, payload) for payload in payloads]
+
     @staticmethod
     def _parse(param: str) -> Any:
-        input_stream = InputStream(param)
-        lexer = trainingLexer(input_stream)
+        lexer = trainingLexer(InputStream(''))
         token_stream = CommonTokenStream(lexer)
-        token_stream.fill()
         parser = trainingParser(token_stream)
+        return Splitter._parse_reusing(lexer, token_stream, parser, param)
+
+    @staticmethod
+    def _parse_reusing(lexer: trainingLexer, token_stream: CommonTokenStream, parser: trainingParser,
+                       param: str) -> Any:
+        lexer.inputStream = InputStream(param)
+        token_stream.setTokenSource(lexer)
+        parser.setTokenStream(token_stream)
+        token_stream.fill()
         tree = parser.workout()
 
         formatter = Formatter()
@@ -53,98 +74,98 @@ class Splitter:
 
     @staticmethod
     def _write_output(exercises: list[Parsing2], file_path_: str) -> None:
-        with open(file_path_, mode='w+', newline='') as csvfile:
+        with open(file_path_, mode='w', newline='', buffering=1 << 20) as csvfile:
             csv_writer = csv.writer(csvfile, delimiter='\t', quotechar='"')
-            for job2 in exercises:
-                row: Exercise
-                for row_group in job2['parsed']:
-                    for row in row_group.flatten():
-                        repetitions_ = [i['repetitions'] for i in row.sets_]
-                        weights = [i['weight']['amount'] for i in row.sets_]
-                        assert weights[0] == (sum(weights) / len(weights)), f"Failed condition: Not all weights are equal in '{row}'"
-                        csv_writer.writerow([
-                            job2['date'],
-                            row.name,
-                            "{:d}".format(len(repetitions_)),
-                            "{:d}".format(int(sum(repetitions_) / len(repetitions_))),
-                            "{:.1f}".format(row.sets_[0]['weight']['amount']).replace('.', ',')
-                        ]
-                        )
+            csv_writer.writerows(Splitter._iter_tsv_rows(exercises))
+
+    @staticmethod
+    def _iter_tsv_rows(exercises: list[Parsing2]) -> Iterator[list[str]]:
+        for job2 in exercises:
+            row: Exercise
+            for row_group in job2['parsed']:
+                for row in row_group.flatten():
+                    first_weight = row.sets_[0]['weight']['amount']
+                    assert all(set_['weight']['amount'] == first_weight for set_ in row.sets_), f"Failed condition: Not all weights are equal in '{row}'"
+                    number_of_sets = len(row.sets_)
+                    total_repetitions = sum(set_['repetitions'] for set_ in row.sets_)
+                    yield [
+                        job2['date'],
+                        row.name,
+                        "{:d}".format(number_of_sets),
+                        "{:d}".format(total_repetitions // number_of_sets),
+                        "{:.1f}".format(first_weight).replace('.', ',')
+                    ]
 
     @staticmethod
     def _group_exercises(lines: list[str]) -> list[Parsing1]:
         jobs: list[Parsing1] = []
-        current: list[Any] = []
+        current: list[str] = []
         notes: list[str] = []
-        date: Any = None
-        for idx in range(len(lines)):
-            if lines[idx] == '':
+        date: Optional[str] = None
+        for line in lines:
+            if not line:
                 jobs.append(Splitter.build_job(current, date, notes))
                 notes = []
                 current = []
                 date = None
-                continue
-            if lines[idx].startswith('#'):
-                notes.append(lines[idx])
-                continue
-            if date is None:
-                date = lines[idx]
-                continue
-            current.append(lines[idx])
+            elif line[0] == '#':
+                notes.append(line)
+            elif date is None:
+                date = line
+            else:
+                current.append(line)
 
         jobs.append(Splitter.build_job(current, date, notes))
         return jobs
 
     @staticmethod
-    def build_job(current: List[Any], date: Any, notes: list[str]) -> Parsing1:
-        current.append("")
+    def build_job(current: list[str], date: Optional[str], notes: list[str]) -> Parsing1:
         assert date is not None, f"current={current}, date={date}, notes={notes}"
         return {'date': date,
-                'payload': "\n".join(current.copy()),
-                'notes': "\n".join(notes.copy())
+                'payload': "\n".join(current) + "\n",
+                'notes': "\n".join(notes)
                 }
 
     @staticmethod
     def _read_all_lines(file_name: str) -> list[str]:
-        lines: list[str] = []
-        file_path: TextIO
         with open(file_name, 'r') as file_path:
-            while True:
-                line = file_path.readline()
-                if not line:
-                    break
-                lines.append(line.rstrip())
-        return lines
+            return [line.rstrip() for line in file_path.read().splitlines()]
 
     @staticmethod
     def _rename_exercises(parsing2s: list[Parsing2]) -> list[Parsing2]:
-        renamer = StandardizeName()
+        renamer = _renamer
+        renamed: dict[str, str] = {}
         for parsing2 in parsing2s:
             for exercise in parsing2['parsed']:
-                exercise.name = renamer.run(exercise.name)
+                raw_name = exercise.name
+                if raw_name not in renamed:
+                    renamed[raw_name] = renamer.run(raw_name)
+                exercise.name = renamed[raw_name]
         return parsing2s
 
     @staticmethod
     def _debug_print(workouts: list[Parsing2]) -> None:
 
-        print("Debug printing.")
+        out: list[str] = ["Debug printing.\n"]
         total_volume: float = 0
         for workout in workouts:
             total_volume_for_workout: float = 0
-            print(f"## {workout['date']}")
+            out.append(f"## {workout['date']}\n")
             if workout['notes']:
-                print(f"  Notes: {workout['notes']}")
+                out.append(f"  Notes: {workout['notes']}\n")
 
             for exercise in workout['parsed']:
-                print(f"  {exercise.__repr__()}; subtotal: {exercise.total_volume()}")
-                total_volume_for_workout += exercise.total_volume()
-                total_volume += exercise.total_volume()
-            print(f"  # Stats for this session")
+                exercise_volume = exercise.total_volume()
+                out.append(f"  {exercise.__repr__()}; subtotal: {exercise_volume}\n")
+                total_volume_for_workout += exercise_volume
+                total_volume += exercise_volume
+            out.append("  # Stats for this session\n")
 
-            print(f"  Total number of exercises: {len(workout['parsed'])}")
-            print(f"  Total volume this workout: {total_volume_for_workout}")
+            out.append(f"  Total number of exercises: {len(workout['parsed'])}\n")
+            out.append(f"  Total volume this workout: {total_volume_for_workout}\n")
 
-        print(f"Total volume for all workouts: {total_volume}")
+        out.append(f"Total volume for all workouts: {total_volume}\n")
+        sys.stdout.writelines(out)
 
 
 if __name__ == "__main__":